@@ -1,14 +1,24 @@
 """Argument parsing for plansi."""
 
 import argparse
+import functools
 import os
 import sys
 from . import __version__
 from .implied import Implied, implied
 
 
-def parse_args(argv=sys.argv[1:]):
-    """Parse command-line arguments."""
+def _unit_interval(value):
+    """Parse a float in [0, 1], rejecting anything chafa would refuse."""
+    number = float(value)
+    if not 0.0 <= number <= 1.0:
+        raise argparse.ArgumentTypeError(f"must be between 0 and 1, got {value}")
+    return number
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser():
+    """Build the argument parser once; it holds no per-invocation state."""
     parser = argparse.ArgumentParser(
         description="Play videos as ANSI in terminal with smart format detection",
         epilog="""Examples:
@@ -27,22 +37,15 @@ def parse_args(argv=sys.argv[1:]):
     parser.add_argument(
         "output",
         nargs="?",
-        default=Implied("-"),
+        default=None,
         help="Output destination: .cast file for recording, or '-' for terminal playback (default: terminal)",
     )
-
-    # Auto-detect terminal width
-    try:
-        default_width = os.get_terminal_size().columns
-    except OSError:
-        default_width = 80  # Fallback if not in a terminal
-
     parser.add_argument(
         "--width",
         "-w",
         type=int,
-        default=Implied(default_width),
-        help=f"Terminal width in characters (default: auto-detected {default_width})",
+        default=None,
+        help="Terminal width in characters (default: auto-detected)",
     )
     parser.add_argument(
         "--fps",
@@ -55,9 +58,15 @@ def parse_args(argv=sys.argv[1:]):
         "--threshold",
         "-t",
         type=float,
-        default=Implied(5.0),
+        default=None,
         help="Perceptual color difference threshold (0-100). Lower = more sensitive. (default: 5.0)",
     )
+    parser.add_argument(
+        "--work-factor",
+        type=_unit_interval,
+        default=None,
+        help="Chafa rendering effort (0-1). Lower = faster, rougher symbols. (default: 0.3 in realtime, else 1.0)",
+    )
     parser.add_argument(
         "--no-diff", action="store_true", help="Disable differential rendering (always output full frames)"
     )
@@ -68,7 +77,7 @@ def parse_args(argv=sys.argv[1:]):
     parser.add_argument(
         "--cache-position",
         action="store_true",
-        help="Cache cursor positions to reduce movement (experimental, may cause artifacts)",
+        help="Use shorter relative cursor moves instead of absolute positioning where possible",
     )
     parser.add_argument(
         "--no-cache-style",
@@ -98,33 +107,82 @@ def parse_args(argv=sys.argv[1:]):
         default=None,
         help="Force input format: video (mp4/avi/etc), cast (asciinema), ansi (raw text) (default: auto-detect)",
     )
+    return parser
+
+
+def parse_args(argv=sys.argv[1:]):
+    """Parse command-line arguments."""
+    # The implied defaults depend on the terminal as well as argv, so both go
+    # in the key; callers get their own copy to mutate
+    args = _parse_args(tuple(argv), sys.stdout.isatty(), _terminal_width())
+    return argparse.Namespace(**vars(args))
+
 
-    args = parser.parse_args(argv)
+@functools.lru_cache(maxsize=64)
+def _parse_args(argv, stdout_isatty, terminal_width):
+    """Parse argv and resolve the implied defaults, once per distinct input.
+
+    stdout_isatty and terminal_width only key the cache; the _set_* helpers
+    look them up for themselves.
+    """
+    args = _build_parser().parse_args(list(argv))
 
     # Set implied defaults using helper functions
+    _set_width(args)
+    _set_threshold(args)
     _set_input_format(args)
     _set_output_flags(args)
     _set_debug(args)
     _set_realtime(args)
+    _set_work_factor(args)
     _set_perceptual(args)
 
     return args
 
 
+# Input format by file extension; anything not listed (URLs included) is
+# handed to PyAV as video
+_FORMAT_BY_EXTENSION = {"cast": "cast"}
+
+
 def _detect_input_format(input_path):
     """Detect input format from file path/URL."""
     if input_path == "-":
         # stdin - assume ANSI data
         return "ansi"
-    elif input_path.startswith(("http://", "https://")):
-        # URL - check extension or assume video
-        return "cast" if input_path.endswith(".cast") else "video"
-    elif input_path.endswith(".cast"):
-        # Local .cast file
-        return "cast"
-    else:
-        # Assume video file
-        return "video"
+    if "://" in input_path:
+        # The extension belongs to the URL's path, not its query or fragment
+        input_path = input_path.partition("?")[0].partition("#")[0]
+    extension = os.path.splitext(input_path)[1][1:].lower()
+    return _FORMAT_BY_EXTENSION.get(extension, "video")
+
+
+def _terminal_width():
+    """Terminal width from $COLUMNS, falling back to asking the terminal."""
+    try:
+        columns = int(os.environ.get("COLUMNS", ""))
+    except ValueError:
+        columns = 0
+    return columns if columns > 0 else _probe_terminal_width()
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_terminal_width():
+    """Ask the terminal for its width, once per process."""
+    try:
+        return os.get_terminal_size().columns
+    except OSError:
+        return 80  # Fallback if not in a terminal
+
+
+def _set_width(args):
+    """Set width from the terminal when not given explicitly."""
+    args.width = Implied(_terminal_width(), args.width)
+
+
+def _set_threshold(args):
+    """Set the default perceptual threshold when not given explicitly."""
+    args.threshold = Implied(5.0, args.threshold)
 
 
 def _set_input_format(args):
@@ -135,6 +193,9 @@ def _set_input_format(args):
 
 def _set_output_flags(args):
     """Set output-related flags."""
+    # No output destination means terminal playback
+    args.output = Implied("-", args.output)
+
     # Set stdout flag based on output destination
     if args.output == "-":
         # stdout follows the same implied/explicit status as output
@@ -157,6 +218,12 @@ def _set_realtime(args):
     args.realtime = Implied(output_is_a_tty, args.realtime)
 
 
+def _set_work_factor(args):
+    """Set chafa's work factor based on realtime playback."""
+    # Realtime playback can't wait on chafa's full symbol search; recordings can
+    args.work_factor = Implied(0.3 if args.realtime else 1.0, args.work_factor)
+
+
 def _set_perceptual(args):
     """Set perceptual flag based on input format."""
     # Auto-detect based on input format
@@ -1,15 +1,26 @@
 """Command-line interface for plansi."""
 
-import atexit
+import collections
+import os
 import sys
-from .control_codes import SHOW_CURSOR, RESTORE_TERMINAL
+from .control_codes import RESTORE_TERMINAL_B
 from .args import parse_args
-from .pipeline import build_pipeline
 
 
-def restore_cursor():
-    """Restore cursor visibility on exit."""
-    print(SHOW_CURSOR, end="", flush=True)
+def _write_terminal(codes):
+    """Write pre-encoded control codes straight to stdout, after any pending text."""
+    sys.stdout.flush()
+    try:
+        os.write(sys.stdout.fileno(), codes)
+    except OSError:
+        # No real fd behind stdout (captured, wrapped)
+        sys.stdout.buffer.write(codes)
+        sys.stdout.buffer.flush()
+
+
+def restore_terminal():
+    """Reset style and show the cursor once the pipeline is done, however it ended."""
+    _write_terminal(RESTORE_TERMINAL_B)
 
 
 def _debug_args_and_pipeline(args, pipeline):
@@ -37,13 +48,15 @@ def _print_pipeline_tree(pipe, level):
 
 def main():
     """Main CLI entry point."""
-    # Register cursor restoration for any exit scenario
-    atexit.register(restore_cursor)
-
-    # Parse arguments
+    # Parse arguments - --help, --version and usage errors exit here, before
+    # anything has touched the terminal
     args = parse_args()
 
     try:
+        # Imported late: the pipeline pulls in av, chafa and bittty, which
+        # argument parsing doesn't need
+        from .pipeline import build_pipeline
+
         # Build pipeline
         pipeline, is_file_output = build_pipeline(args)
 
@@ -52,20 +65,24 @@ def main():
             _debug_args_and_pipeline(args, pipeline)
             sys.exit(0)
 
-        # Process pipeline
-        for _ in pipeline:
-            pass  # Pipeline handles output
+        # Process pipeline - the stages write the output themselves, so just
+        # drain it; a zero-length deque consumes in C without keeping anything
+        collections.deque(pipeline, maxlen=0)
 
         # Success message for file output
         if is_file_output:
             print(f"Wrote cast file: {args.output}", file=sys.stderr)
 
     except KeyboardInterrupt:
-        # Clean exit on Ctrl+C
-        print(RESTORE_TERMINAL, flush=True)
+        # Clean exit on Ctrl+C, off the video's last line
+        _write_terminal(b"\n")
         sys.exit(0)
     except Exception:
-        # Restore cursor on any error
-        print(RESTORE_TERMINAL, flush=True)
+        _write_terminal(b"\n")
         # Let the exception propagate with full stack trace
         raise
+    finally:
+        # The one place the terminal is restored: covers every exit path out
+        # of here, sys.exit included, and runs before interpreter shutdown
+        # starts tearing modules down
+        restore_terminal()
@@ -4,6 +4,8 @@ This module centralizes all ANSI escape sequences used throughout plansi,
 providing well-named constants that are self-documenting and easy to maintain.
 """
 
+import functools
+
 # Terminal setup and cleanup
 CLEAR_SCREEN = "\x1b[2J"
 CLEAR_TO_EOL = "\x1b[K"
@@ -13,6 +15,10 @@ SHOW_CURSOR = "\x1b[?25h"
 DISABLE_LINE_WRAP = "\x1b[?7l"
 ENABLE_LNM = "\x1b[?20h"  # Line Feed/New Line Mode - makes \n behave like \r\n
 
+# Cursor save/restore (DECSC/DECRC): position and SGR attributes together
+SAVE_CURSOR = "\x1b7"
+RESTORE_CURSOR = "\x1b8"
+
 # Text styling
 RESET_STYLE = "\x1b[0m"
 
@@ -20,5 +26,56 @@ RESET_STYLE = "\x1b[0m"
 SETUP_TERMINAL = CLEAR_SCREEN + HOME_CURSOR + HIDE_CURSOR
 RESTORE_TERMINAL = RESET_STYLE + SHOW_CURSOR  # Reset + show cursor
 
+# Pre-encoded for writing straight to binary stdout
+SETUP_TERMINAL_B = SETUP_TERMINAL.encode("ascii")
+RESTORE_TERMINAL_B = RESTORE_TERMINAL.encode("ascii")
+SHOW_CURSOR_B = SHOW_CURSOR.encode("ascii")
+HIDE_CURSOR_B = HIDE_CURSOR.encode("ascii")
+HOME_CURSOR_B = HOME_CURSOR.encode("ascii")
+
 # Cursor movement (use .format(row+1, col+1) for 1-based positioning)
 MOVE_CURSOR = "\x1b[{};{}H"
+
+
+@functools.lru_cache(maxsize=65536)
+def move_cursor(row: int, col: int) -> str:
+    """MOVE_CURSOR for a 0-based (row, col), built once per position.
+
+    The same positions come up frame after frame, so the formatted
+    sequences are cached rather than rebuilt for every changed cell.
+    """
+    return f"\x1b[{row + 1};{col + 1}H"
+
+
+def _horizontal_move(from_col: int, col: int) -> str:
+    """Shortest way along the current row: CUF/CUB, or CR then CUF."""
+    dx = col - from_col
+    if dx == 0:
+        return ""
+    if dx > 0:
+        return f"\x1b[{dx}C" if dx > 1 else "\x1b[C"
+    back = f"\x1b[{-dx}D" if dx < -1 else "\x1b[D"
+    home = "\r" + _horizontal_move(0, col)
+    return home if len(home) < len(back) else back
+
+
+@functools.lru_cache(maxsize=65536)
+def relative_move(from_row: int, from_col: int, row: int, col: int) -> str:
+    """Shortest sequence taking the cursor from one 0-based position to another.
+
+    Picks between absolute CUP and relative moves (CUU/CUD for rows, CUF/CUB
+    or a CR for columns, CR LF for the start of the next row), so it is only
+    correct while the cursor really is at (from_row, from_col).
+    """
+    dy = row - from_row
+    if dy == 0:
+        vertical = ""
+    elif dy > 0:
+        vertical = f"\x1b[{dy}B" if dy > 1 else "\x1b[B"
+    else:
+        vertical = f"\x1b[{-dy}A" if dy < -1 else "\x1b[A"
+
+    candidates = [move_cursor(row, col), vertical + _horizontal_move(from_col, col)]
+    if dy == 1:
+        candidates.append("\r\n" + _horizontal_move(0, col))
+    return min(candidates, key=len)
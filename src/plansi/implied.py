@@ -2,6 +2,8 @@ import operator
 
 
 class Implied:
+    __slots__ = ("_value",)
+
     def __new__(cls, default, specified=None):
         if specified is not None:
             return type(specified)(specified)
@@ -22,9 +24,11 @@ class Implied:
     def __repr__(self):
         return f"{repr(self._value)} (implied)"
 
-    def __getattribute__(self, name):
-        if name in {"_value", "__class__", "__dict__", "__str__", "__repr__"}:
-            return super().__getattribute__(name)
+    def __getattr__(self, name):
+        # Only reached when normal lookup misses, so our own slot, methods and
+        # forwarded dunders cost nothing extra; everything else is the value's
+        if name == "_value":
+            raise AttributeError(name)
         return getattr(self._value, name)
 
 
@@ -48,6 +52,7 @@ def forward(name):
 _operator_map = {
     "__bool__": operator.truth,
     "__int__": int,
+    "__float__": float,
     "__index__": operator.index,
     "__len__": operator.length_hint,  # or len, but this handles fallbacks
     "__getitem__": operator.getitem,
@@ -76,6 +81,7 @@ _operator_map = {
     "__pow__": operator.pow,
     "__rpow__": operator.pow,
     "__contains__": operator.contains,
+    "__format__": format,
 }
 
 
@@ -4,9 +4,13 @@ This module provides functions for calculating perceptual differences between co
 and terminal cells, using LAB color space for human-perception-based comparisons.
 """
 
+import functools
 import math
 
 
+# Colours arrive quantized to 5 bits per channel, so there are at most 32768
+# distinct inputs - small enough to keep every conversion.
+@functools.lru_cache(maxsize=32768)
 def rgb_to_lab(rgb: tuple) -> tuple:
     """Convert RGB to LAB color space for perceptual color comparison.
 
@@ -58,14 +62,10 @@ def color_distance(color1: tuple, color2: tuple) -> float:
     Returns:
         Perceptual distance between colors (Delta E in LAB space)
     """
-    lab1 = rgb_to_lab(color1)
-    lab2 = rgb_to_lab(color2)
-
-    L1, a1, b1 = lab1
-    L2, a2, b2 = lab2
-
-    # Delta E CIE76 formula
-    return math.sqrt((L1 - L2) ** 2 + (a1 - a2) ** 2 + (b1 - b2) ** 2)
+    # Delta E CIE76: plain Euclidean distance in LAB. The root can't be
+    # squared away - callers scale and sum distances rather than compare them
+    # - so math.dist at least does the whole thing in C.
+    return math.dist(rgb_to_lab(color1), rgb_to_lab(color2))
 
 
 def quantize_rgb(color: tuple) -> tuple:
@@ -77,9 +77,10 @@ def quantize_rgb(color: tuple) -> tuple:
     Returns:
         Quantized RGB tuple
     """
-    # Reduce from 8-bit to 5-bit per channel (32 levels each)
+    # Reduce from 8-bit to 5-bit per channel (32 levels each) by masking off
+    # the low bits - same result as r // 8 * 8, in one integer op
     r, g, b = color
-    return (r // 8 * 8, g // 8 * 8, b // 8 * 8)
+    return (r & 0xF8, g & 0xF8, b & 0xF8)
 
 
 def resolve_rgb(color, palette, fallback: tuple) -> tuple:
@@ -118,7 +119,10 @@ def visual_difference(cell1: tuple, cell2: tuple, palette) -> float:
     style1, _ = cell1
     style2, _ = cell2
 
-    # Early exit before expensive color extraction
+    # Early exit before expensive color extraction; shared style objects
+    # (the common case for cached styles) skip even the field compares
+    if style1 is style2:
+        return 0.0
     if style1.reverse == style2.reverse and style1.fg == style2.fg and style1.bg == style2.bg:
         return 0.0
 
@@ -10,6 +10,7 @@ from .image_to_ansi import ImageToAnsi
 from .player import TerminalPlayer
 from .buffer import AnsiBuffer
 from .winch import ResizeWatcher
+from .prefetch import Prefetch
 
 __all__ = [
     "Pipe",
@@ -22,4 +23,5 @@ __all__ = [
     "TerminalPlayer",
     "AnsiBuffer",
     "ResizeWatcher",
+    "Prefetch",
 ]
@@ -1,18 +1,30 @@
 """Base Pipe class for composable pipeline stages."""
 
 import os
+import sys
 from typing import Iterator, Tuple, Any
 
 
 class Event:
     """Event object for pipeline communication."""
 
+    __slots__ = ("name", "args", "kwargs")
+
     def __init__(self, name: str, *args, **kwargs):
-        self.name = name
+        self.name = sys.intern(name)  # Same object as the handler table's key
         self.args = args
         self.kwargs = kwargs
 
 
+def _event_handlers(cls) -> dict:
+    """Map event name -> on_<name> function for a Pipe class."""
+    return {
+        sys.intern(name[3:]): getattr(cls, name)
+        for name in dir(cls)
+        if name.startswith("on_") and name != "on_event" and callable(getattr(cls, name))
+    }
+
+
 class Pipe:
     """Base class for pipeline stages that process (timestamp, data) streams.
 
@@ -20,6 +32,26 @@ class Pipe:
     for processing input streams. Subclasses implement process() to transform data.
     """
 
+    # The state every stage has lives in fixed slots, and the stages in this
+    # package declare slots for their own state too, so none of them carries
+    # a __dict__. A subclass that doesn't declare __slots__ gets one back and
+    # can set whatever attributes it likes.
+    __slots__ = (
+        "input",
+        "args",
+        "debug_msg",
+        "debug_lines",
+        "log",
+        "width",
+        "height",
+        "__weakref__",
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        """Collect the subclass's event handlers, once per class."""
+        super().__init_subclass__(**kwargs)
+        cls._event_handlers_table = _event_handlers(cls)
+
     def __init__(self, input_pipe, args=None):
         """Initialize pipe with input and arguments.
 
@@ -30,6 +62,8 @@ class Pipe:
         self.input = input_pipe
         self.args = args or {}
         self.debug_msg = {}
+        self.debug_lines = {}  # The same messages, rendered for display
+        self.log = None  # --log-file handle, opened by the first debug() call
         # Standard dimensions - all pipes have them
         self.width = getattr(args, "width", 80) if args else 80
         self.height = 24  # Default height, updated by resize events
@@ -52,8 +86,13 @@ class Pipe:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exit context and call teardown."""
-        self.teardown()
+        """Exit context, call teardown and close the debug log."""
+        try:
+            self.teardown()
+        finally:
+            if self.log is not None:
+                self.log.close()
+                self.log = None
 
     def setup(self):
         """Override to initialize resources."""
@@ -65,22 +104,28 @@ class Pipe:
 
     def debug(self, key: str, value: str):
         """Store debug message for display later."""
-        self.debug_msg[key] = str(value)
-
-        # Log to file if specified
+        value = str(value)
+        self.debug_msg[key] = value
+        # Rendered once here rather than on every all_debug_msgs() call
+        line = f"{type(self).__name__}.{key}: {value}"
+        self.debug_lines[key] = line
+
+        # Log to file if specified - opened once and kept until teardown;
+        # line buffered so the log can be followed during playback
         if hasattr(self.args, "log_file") and self.args.log_file:
-            log_msg = f"{type(self).__name__}.{key}: {value}\n"
-            os.makedirs(os.path.dirname(self.args.log_file), exist_ok=True)
-            with open(self.args.log_file, "a") as f:
-                f.write(log_msg)
+            if self.log is None:
+                log_dir = os.path.dirname(self.args.log_file)
+                if log_dir:
+                    os.makedirs(log_dir, exist_ok=True)
+                self.log = open(self.args.log_file, "a", buffering=1)
+            self.log.write(line + "\n")
 
     def all_debug_msgs(self) -> str:
         msg = ""
         if hasattr(self.input, "all_debug_msgs"):
             msg += self.input.all_debug_msgs() + "\n"
-        class_name = type(self).__name__
-        for key, value in self.debug_msg.items():
-            msg += f"{class_name}.{key}: {value}\n"
+        # Snapshot: upstream stages may be adding keys from a Prefetch worker
+        msg += "\n".join(list(self.debug_lines.values()))
         return msg.rstrip("\n")
 
     def process(self, timestamp: float, data: Any) -> Iterator[Tuple[float, Any]]:
@@ -99,13 +144,20 @@ class Pipe:
         """Handle an event and optionally yield output.
 
         Default implementation calls on_<event_name> if it exists,
-        otherwise propagates the event downstream.
+        otherwise propagates the event downstream. A handler is either a
+        generator yielding output, or a plain function returning None to
+        consume the event without building a generator to do it.
+
+        Handlers are resolved per class, when the class is created: an
+        on_<name> set on an instance, or added to the class afterwards, is
+        not dispatched to.
         """
-        method_name = f"on_{event.name}"
-        handler = getattr(self, method_name, None)
-        if handler and callable(handler):
+        handler = self._event_handlers_table.get(event.name)
+        if handler:
             # Call event handler - it can yield output
-            yield from handler(timestamp, *event.args, **event.kwargs)
+            output = handler(self, timestamp, *event.args, **event.kwargs)
+            if output is not None:
+                yield from output
         else:
             # No handler - propagate event downstream
             yield timestamp, event
@@ -118,3 +170,6 @@ class Pipe:
             self.debug("resized", f"{width}x{height}")
         # Propagate event downstream
         yield timestamp, Event("resize", width=width, height=height)
+
+
+Pipe._event_handlers_table = _event_handlers(Pipe)
@@ -3,9 +3,10 @@
 from typing import Iterator, Tuple, Any
 from bittty import Board
 from bittty.style import style_to_ansi
+from bittty.video import WideHead
 
 from .base import Pipe
-from ..control_codes import DISABLE_LINE_WRAP, ENABLE_LNM, MOVE_CURSOR, RESET_STYLE
+from ..control_codes import DISABLE_LINE_WRAP, ENABLE_LNM, RESET_STYLE, move_cursor, relative_move
 from .. import perceptual
 
 
@@ -31,6 +32,18 @@ class AnsiBuffer(Pipe):
         cache_style: Enable style caching (default: True)
     """
 
+    __slots__ = (
+        "truth_board",
+        "viewer_board",
+        "truth_page",
+        "truth_seen",
+        "first_frame",
+        "frame_count",
+        "current_cursor_x",
+        "current_cursor_y",
+        "current_style",
+    )
+
     def setup(self):
         """Initialize the truth and viewer boards."""
         self.truth_board = Board(width=self.width, height=self.height)
@@ -41,13 +54,18 @@ class AnsiBuffer(Pipe):
         self.viewer_board.parser.feed(DISABLE_LINE_WRAP)
         self.viewer_board.parser.feed(ENABLE_LNM)
 
-        # State tracking for optimized output
-        self.current_cursor_x = 0
-        self.current_cursor_y = 0
+        # State tracking for optimized output; a None cursor is unknown
+        self.current_cursor_x = None
+        self.current_cursor_y = None
         self.current_style = None
         self.frame_count = 0
         self.first_frame = True
 
+        # Change tracking on the truth side: the page we last diffed and the
+        # bittty dirty-tracking epoch we saw it at
+        self.truth_page = None
+        self.truth_seen = 0
+
     def process(self, timestamp: float, data: Any) -> Iterator[Tuple[float, str]]:
         """Process ANSI through bittty and generate differential output.
 
@@ -60,6 +78,16 @@ class AnsiBuffer(Pipe):
         """
         self.truth_board.parser.feed(data)
 
+        # Which rows did this input draw on? All of them after a page switch;
+        # a resize marks the whole page dirty by itself
+        truth_page = self.truth_board.blitter.current_buffer
+        if truth_page is self.truth_page:
+            touched_rows = truth_page.dirty_rows(self.truth_seen)
+        else:
+            touched_rows = range(truth_page.height)
+        self.truth_page = truth_page
+        self.truth_seen = truth_page.observe()
+
         # First frame: pass through verbatim - the viewer sees exactly what we sent
         if self.first_frame:
             self.first_frame = False
@@ -68,66 +96,97 @@ class AnsiBuffer(Pipe):
             self.frame_count += 1
             return
 
-        # Reset state tracking for this frame
-        self.current_cursor_x = 0
-        self.current_cursor_y = 0
+        # Nothing drawn since the last diff: the viewer hasn't changed either,
+        # so the walk would reach the same decisions (threshold-suppressed
+        # cells included) and emit nothing. Skip it. The same goes for each
+        # untouched row below.
+        if not touched_rows:
+            self._debug_frame(0)
+            self.frame_count += 1
+            return
+
+        # Reset state tracking for this frame: whatever was written since our
+        # last diff (the first frame, debug lines) has moved the cursor
+        self.current_cursor_x = None
+        self.current_cursor_y = None
         self.current_style = None
 
         output = []
         cells_changed = 0
-        cells_total = 0
-        truth_page = self.truth_board.blitter.current_buffer
+        # At threshold 0 every unequal cell is a change - no need to ask
+        check_threshold = self.args.threshold != 0
         viewer_page = self.viewer_board.blitter.primary_buffer
 
-        for row in range(self.height):
-            cells_total += self.width
+        # Walk the grids' row lists directly rather than paying get_cell's
+        # call overhead per cell. The input can resize the truth board on its
+        # own (CSI 8;rows;cols t), so only the area both boards share is
+        # compared: rows past the viewer's are skipped, and zip stops at the
+        # narrower row.
+        truth_grid = truth_page.grid
+        viewer_grid = viewer_page.grid
+        viewer_height = len(viewer_grid)
+        for row in touched_rows:
+            if row >= viewer_height:
+                break  # touched rows come in ascending order
+            truth_row = truth_grid[row]
+            viewer_row = viewer_grid[row]
 
             # Fast path: identical rows need no perceptual math at all
-            if truth_page.grid[row] == viewer_page.grid[row]:
+            if truth_row == viewer_row:
                 continue
 
-            for col in range(self.width):
-                viewer_cell = viewer_page.get_cell(col, row)
-                truth_cell = truth_page.get_cell(col, row)
-
-                if self._cells_different(viewer_cell, truth_cell):
-                    cells_changed += 1
-
-                    # Generate cursor movement if needed
-                    cursor_move = self._generate_cursor_movement(col, row)
-                    if cursor_move:
-                        output.append(cursor_move)
-                        self.current_cursor_x = col
-                        self.current_cursor_y = row
-
-                    # Generate style changes: bittty's cached diff when we know
-                    # the current state, reset + full style when we don't
-                    truth_style, truth_char = truth_cell
-                    if self.args.cache_style and self.current_style is not None:
-                        style_changes = self.current_style.diff(truth_style)
-                    else:
-                        style_changes = RESET_STYLE + style_to_ansi(truth_style)
-                    if style_changes:
-                        output.append(style_changes)
-                    self.current_style = truth_style
-
-                    # Output character, and land it on the viewer board
+            for col, (viewer_cell, truth_cell) in enumerate(zip(viewer_row, truth_row)):
+                # Most cells on a changed row still match: the same shared
+                # cell object, or an equal style and character
+                if viewer_cell is truth_cell or viewer_cell == truth_cell:
+                    continue
+                if check_threshold and not self._cells_different(viewer_cell, truth_cell):
+                    continue
+
+                cells_changed += 1
+
+                # Generate cursor movement if needed
+                cursor_move = self._generate_cursor_movement(col, row)
+                if cursor_move:
+                    output.append(cursor_move)
+                    self.current_cursor_x = col
+                    self.current_cursor_y = row
+
+                # Generate style changes: bittty's cached diff when we know
+                # the current state, reset + full style when we don't
+                truth_style, truth_char = truth_cell
+                if self.args.cache_style and self.current_style is not None:
+                    style_changes = self.current_style.diff(truth_style)
+                else:
+                    style_changes = RESET_STYLE + style_to_ansi(truth_style)
+                if style_changes:
+                    output.append(style_changes)
+                self.current_style = truth_style
+
+                # Output character, and land it on the viewer board. A
+                # narrow glyph over another narrow glyph splits nothing, so
+                # it can share the truth cell outright; anything wide goes
+                # through set_cell to clear the glyph halves it overwrites.
+                wide = isinstance(truth_char, WideHead)
+                viewer_char = viewer_cell[1]
+                if truth_char and not wide and viewer_char and not isinstance(viewer_char, WideHead):
+                    output.append(truth_char)
+                    viewer_row[col] = truth_cell
+                else:
                     char = truth_char if truth_char else " "
                     output.append(char)
                     viewer_page.set_cell(col, row, char, truth_style)
 
-                    # Update cursor position after character
-                    self.current_cursor_x = col + 1
-                    if self.current_cursor_x >= self.width:
-                        self.current_cursor_x = 0
-                        self.current_cursor_y += 1
-
-        # Debug info
-        if self.args.debug:
-            self.debug("frame", str(self.frame_count))
-            self.debug("changed", f"{cells_changed}/{cells_total}")
-            self.debug("threshold", f"{self.args.threshold:.1f}")
+                # Track where the character left the cursor. Past the right
+                # margin that's down to the terminal's wrap handling, so
+                # the next cell gets positioned explicitly.
+                self.current_cursor_x = col + (2 if wide else 1)
+                self.current_cursor_y = row
+                if self.current_cursor_x >= self.width:
+                    self.current_cursor_x = None
+                    self.current_cursor_y = None
 
+        self._debug_frame(cells_changed)
         self.frame_count += 1
 
         # Output differential ANSI; silent frames vanish from the stream
@@ -135,6 +194,13 @@ class AnsiBuffer(Pipe):
         if ansi_output:
             yield timestamp, ansi_output
 
+    def _debug_frame(self, cells_changed: int):
+        """Record per-frame debug info."""
+        if self.args.debug:
+            self.debug("frame", str(self.frame_count))
+            self.debug("changed", f"{cells_changed}/{self.width * self.height}")
+            self.debug("threshold", f"{self.args.threshold:.1f}")
+
     def _cells_different(self, viewer_cell: tuple, truth_cell: tuple) -> bool:
         """Check if two cells are visually different enough to update.
 
@@ -163,6 +229,11 @@ class AnsiBuffer(Pipe):
     def _generate_cursor_movement(self, target_col: int, target_row: int) -> str:
         """Generate minimal cursor movement to target position.
 
+        Runs of changed cells need no movement at all: each character leaves
+        the cursor on the next one. With cache_position, and the cursor
+        position known, the move is whichever of absolute or relative motion
+        is shortest.
+
         Args:
             target_col: Target column (0-based)
             target_row: Target row (0-based)
@@ -170,20 +241,16 @@ class AnsiBuffer(Pipe):
         Returns:
             ANSI escape sequence for cursor movement, or empty string
         """
-        if not self.args.cache_position:
-            # Always generate explicit positioning
-            return MOVE_CURSOR.format(target_row + 1, target_col + 1)
-
         # Already at target position
         if self.current_cursor_x == target_col and self.current_cursor_y == target_row:
             return ""
 
-        # Natural progression (next column on same row)
-        if target_col == self.current_cursor_x + 1 and target_row == self.current_cursor_y:
-            return ""
+        # Relative to where we left it
+        if self.args.cache_position and self.current_cursor_x is not None:
+            return relative_move(self.current_cursor_y, self.current_cursor_x, target_row, target_col)
 
         # Need explicit cursor positioning
-        return MOVE_CURSOR.format(target_row + 1, target_col + 1)
+        return move_cursor(target_row, target_col)
 
     def on_resize(self, timestamp: float, width: int, height: int) -> Iterator[Tuple[float, Any]]:
         """Handle resize event - resize boards first, then propagate."""
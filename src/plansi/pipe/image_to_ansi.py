@@ -4,7 +4,7 @@ from typing import Iterator, Tuple, Any
 from chafa import PixelMode, DitherMode, PixelType, Canvas, ColorSpace, CanvasConfig, CanvasMode
 
 from .base import Pipe, Event
-from ..control_codes import HIDE_CURSOR, HOME_CURSOR, SHOW_CURSOR
+from ..control_codes import HIDE_CURSOR_B, HOME_CURSOR_B, SHOW_CURSOR_B
 
 
 class ImageToAnsi(Pipe):
@@ -14,6 +14,8 @@ class ImageToAnsi(Pipe):
     Output: (timestamp, ansi_string) full frame ANSI sequences
     """
 
+    __slots__ = ("canvas", "frame_count", "last_output", "last_pixels")
+
     def setup(self):
         """Initialize Chafa canvas."""
         # Get dimensions from args - width is already set by base Pipe class
@@ -24,11 +26,16 @@ class ImageToAnsi(Pipe):
         self.height = None
         self.frame_count = 0
 
+        # The last frame drawn on the current canvas, as (pixels, ansi)
+        self.last_pixels = None
+        self.last_output = None
+
     def teardown(self):
         """Clean up canvas."""
         self.canvas = None
+        self.last_pixels = self.last_output = None
 
-    def on_resize(self, timestamp: float, width: int, height: int) -> Iterator[Tuple[float, Any]]:
+    def on_resize(self, timestamp: float, width: int, height: int) -> None:
         """Rebuild the canvas at the new width; height re-derives from aspect.
 
         The incoming event is swallowed: the canvas init on the next frame
@@ -36,7 +43,7 @@ class ImageToAnsi(Pipe):
         """
         self.width = width
         self.canvas = None
-        yield from ()
+        self.last_pixels = self.last_output = None
 
     def process(self, timestamp: float, data: Any) -> Iterator[Tuple[float, str]]:
         """Convert image to ANSI."""
@@ -56,7 +63,7 @@ class ImageToAnsi(Pipe):
             config.pixel_mode = PixelMode.CHAFA_PIXEL_MODE_SYMBOLS
             config.dither_mode = DitherMode.CHAFA_DITHER_MODE_ORDERED
             config.color_space = ColorSpace.CHAFA_COLOR_SPACE_RGB
-            config.work_factor = 1.0
+            config.work_factor = float(getattr(self.args, "work_factor", 1.0))
             config.width = self.width
             config.height = self.height
 
@@ -73,6 +80,14 @@ class ImageToAnsi(Pipe):
         # Render image to ANSI
         width, height = img.size
         pixel_data = img.tobytes()
+
+        # Still scenes, paused shots and held frames repeat pixel for pixel;
+        # chafa renders the same thing each time, so only render it once
+        if pixel_data == self.last_pixels:
+            self.frame_count += 1
+            yield timestamp, self.last_output
+            return
+
         rowstride = width * 3  # RGB = 3 bytes per pixel
 
         self.canvas.draw_all_pixels(
@@ -83,11 +98,11 @@ class ImageToAnsi(Pipe):
             rowstride,
         )
 
-        # Get ANSI output
-        ansi_output = self.canvas.print().decode("utf-8")
-
-        # Add cursor control for full frame output
-        full_output = HIDE_CURSOR + HOME_CURSOR + ansi_output + SHOW_CURSOR
+        # Get ANSI output, with cursor control for full frame output - joined
+        # as bytes so the frame is copied and decoded once
+        full_output = b"".join((HIDE_CURSOR_B, HOME_CURSOR_B, self.canvas.print(), SHOW_CURSOR_B)).decode("utf-8")
+        self.last_pixels = pixel_data
+        self.last_output = full_output
 
         self.frame_count += 1
 
@@ -1,49 +1,102 @@
 """Terminal player for ANSI sequences."""
 
+import os
+import select
 import sys
 import time
 from typing import Iterator, Tuple, Any
 
 from .base import Pipe
-from ..control_codes import SETUP_TERMINAL, RESTORE_TERMINAL, CLEAR_TO_EOL
+from ..control_codes import SETUP_TERMINAL_B, RESTORE_TERMINAL_B, CLEAR_TO_EOL, RESET_STYLE, SAVE_CURSOR, RESTORE_CURSOR
+
+# Without realtime pacing nobody is watching frame by frame, so output is
+# batched into pipe-sized writes instead of one write + flush per frame
+FLUSH_BYTES = 64 * 1024
+
+
+def _write_all(fd, data):
+    """os.write until everything is out: terminal writes can be partial, and
+    are refused outright while something has left the fd non-blocking."""
+    offset = 0
+    with memoryview(data) as view:
+        while offset < len(view):
+            try:
+                offset += os.write(fd, view[offset:])
+            except BlockingIOError:
+                select.select([], [fd], [])
 
 
 class TerminalPlayer(Pipe):
     """Plays ANSI sequences to terminal with proper timing.
 
+    Output is encoded once per frame into a pending buffer and written to the
+    binary stdout in one go: every frame when playing in realtime (it's due
+    on screen now), or whenever FLUSH_BYTES have piled up otherwise.
+    Realtime writes skip Python's stdout buffering and go straight to the
+    file descriptor.
+
     Input: (timestamp, ansi_string)
     Output: passes through input (for potential monitoring)
     """
 
+    __slots__ = ("start_time", "frame_count", "late_frames", "stdout", "stdout_fd", "pending")
+
     def setup(self):
         """Setup terminal and timing."""
         self.start_time = None
         self.frame_count = 0
         self.late_frames = 0
 
-        # Setup terminal
-        sys.stdout.write(SETUP_TERMINAL)
+        # Both paths below bypass the text layer, so anything already
+        # buffered there has to go first
         sys.stdout.flush()
+        self.stdout = sys.stdout.buffer
+        self.stdout_fd = None
+        if self.args.realtime:
+            try:
+                self.stdout_fd = sys.stdout.fileno()
+            except OSError:
+                pass  # No real fd behind stdout (captured, wrapped): stay buffered
+        self.pending = bytearray()
+
+        # Setup terminal
+        self.pending += SETUP_TERMINAL_B
+        self._flush()
 
     def teardown(self):
         """Restore terminal."""
 
         # Restore terminal and position cursor below content
-        sys.stdout.write(f"{RESTORE_TERMINAL}\x1b[{self.height + 1};1H")
-        sys.stdout.flush()
+        self.pending += RESTORE_TERMINAL_B
+        self.pending += f"\x1b[{self.height + 1};1H".encode()
+        self._flush()
+
+    def _flush(self):
+        """Write everything pending to stdout in a single call."""
+        if not self.pending:
+            return
+        if self.stdout_fd is None:
+            self.stdout.write(self.pending)
+            self.stdout.flush()
+        else:
+            _write_all(self.stdout_fd, self.pending)
+        self.pending.clear()
 
     def process(self, timestamp: float, data: Any) -> Iterator[Tuple[float, Any]]:
         """Output ANSI to terminal with timing control."""
         # Initialize timer on first frame
         if self.start_time is None:
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
             # Always display first frame immediately, regardless of timing
 
         elif self.args.realtime:
             # A differential stream can't drop frames - every diff assumes the
             # previous one landed. When we're behind, we drop the sleep instead
             # and the video runs at whatever speed the pipeline manages.
-            sleep_time = timestamp - (time.time() - self.start_time)
+            # Deadlines are absolute on a monotonic clock, so time spent on
+            # earlier frames never accumulates as drift and wall-clock
+            # adjustments can't stall or rush playback.
+            sleep_time = self.start_time + timestamp - time.monotonic()
             if sleep_time > 0:
                 time.sleep(sleep_time)
             else:
@@ -52,21 +105,27 @@ class TerminalPlayer(Pipe):
                     self.debug("late", self.late_frames)
 
         # Output ANSI data directly - let ANSI sequences control cursor positioning
-        sys.stdout.write(data)
+        self.pending += data.encode()
 
         # Debug info - display all pipeline debug messages
         if self.args.debug:
             self.debug("frame", self.frame_count)
             all_msgs = self.all_debug_msgs()
             if all_msgs:
-                # Position cursor below video and display debug info with clear-to-EOL
+                # Position cursor below video and display debug info with clear-to-EOL.
+                # AnsiBuffer's diffs assume the cursor and style it left behind
+                # (relative moves, no move inside runs, cached SGR), so the
+                # overlay saves both first and puts them back afterwards
                 lines = all_msgs.split("\n")
-                debug_output = "\x1b[0m"
-                for i, line in enumerate(lines):
-                    debug_output += f"\x1b[{self.height + 1 + i};1H{line}{CLEAR_TO_EOL}\n"
-                sys.stdout.write(debug_output)
+                debug_output = [SAVE_CURSOR, RESET_STYLE]
+                debug_output.extend(
+                    f"\x1b[{self.height + 1 + i};1H{line}{CLEAR_TO_EOL}\n" for i, line in enumerate(lines)
+                )
+                debug_output.append(RESTORE_CURSOR)
+                self.pending += "".join(debug_output).encode()
 
-        sys.stdout.flush()
+        if self.args.realtime or len(self.pending) >= FLUSH_BYTES:
+            self._flush()
         self.frame_count += 1
 
         # Pass through for monitoring
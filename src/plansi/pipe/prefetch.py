@@ -0,0 +1,80 @@
+"""Prefetch pipe: runs the upstream stages on a worker thread."""
+
+import queue
+import threading
+from typing import Iterator, Tuple, Any
+
+from .base import Pipe
+
+
+class Prefetch(Pipe):
+    """Pulls from its input on a background thread, a few items ahead.
+
+    PyAV decoding and chafa rendering release the GIL in their C code, so
+    running them on a worker lets them overlap with the pure-Python stages
+    downstream instead of taking turns. Everything upstream comes through
+    in order, events included, and an upstream exception is re-raised on
+    the consuming side.
+
+    Anything that must live on the main thread (signal handlers) has to
+    stay downstream of this pipe.
+
+    Input: any (timestamp, data) stream
+    Output: the same stream
+    """
+
+    __slots__ = ("depth", "queue", "stopping", "worker")
+
+    def __init__(self, input_pipe, args=None, depth: int = 2):
+        """Initialize with the number of items allowed to queue up ahead."""
+        super().__init__(input_pipe, args)
+        self.depth = depth
+
+    def __iter__(self) -> Iterator[Tuple[float, Any]]:
+        """Yield items as the worker produces them."""
+        with self:
+            while True:
+                more, item = self.queue.get()
+                if not more:
+                    if item is not None:
+                        raise item
+                    return
+                yield item
+
+    def setup(self):
+        """Start the worker thread."""
+        self.queue = queue.Queue(maxsize=self.depth)
+        self.stopping = threading.Event()
+        self.worker = threading.Thread(target=self._produce, name=f"{type(self).__name__}-worker", daemon=True)
+        self.worker.start()
+
+    def teardown(self):
+        """Stop the worker, closing the upstream stages on its own thread."""
+        self.stopping.set()
+        self.worker.join()
+
+    def _produce(self):
+        """Worker: iterate the input into the queue until done or told to stop."""
+        upstream = iter(self.input)
+        try:
+            for item in upstream:
+                if not self._put((True, item)):
+                    return
+            self._put((False, None))
+        except Exception as e:
+            self._put((False, e))
+        finally:
+            # Upstream pipes tear down when their generators close
+            close = getattr(upstream, "close", None)
+            if close:
+                close()
+
+    def _put(self, entry) -> bool:
+        """Queue an entry, giving up if the consumer has gone away."""
+        while not self.stopping.is_set():
+            try:
+                self.queue.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
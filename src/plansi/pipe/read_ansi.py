@@ -1,45 +1,61 @@
 """ANSI reader pipe."""
 
+import codecs
 import sys
 import time
 from typing import Iterator, Tuple, Any
 
 from .base import Pipe
 
+# Most a single read hands downstream; read1 returns sooner with whatever has
+# arrived, so live input isn't held back waiting for a full chunk
+CHUNK_BYTES = 64 * 1024
+
 
 class AnsiReader(Pipe):
     """Reads ANSI data from files or stdin and outputs ANSI strings.
 
     Input: (timestamp, filepath) where filepath is path to file or '-' for stdin
-    Output: (timestamp, ansi_string) from the input source
+    Output: (timestamp, ansi_string) chunks of the input as they arrive
     """
 
+    __slots__ = ("start_time",)
+
     def setup(self):
         """Initialize start time."""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
 
     def process(self, timestamp: float, data: Any) -> Iterator[Tuple[float, str]]:
-        """Read ANSI data line by line."""
+        """Read ANSI data in chunks as it arrives, one timestamp per chunk."""
         filepath = data
 
-        # Handle stdin vs file input
+        # Handle stdin vs file input - both read as bytes
         if filepath == "-":
             # Read from stdin
-            input_stream = sys.stdin
+            input_stream = sys.stdin.buffer
         else:
             # Read from file
-            input_stream = open(filepath, "r", encoding="utf-8")
+            input_stream = open(filepath, "rb")
+
+        # Reads can split a multi-byte character; the decoder carries it over
+        decoder = codecs.getincrementaldecoder("utf-8")()
 
         try:
-            line_count = 0
-            for line in input_stream:
-                # Use elapsed time since setup
-                elapsed_time = time.time() - self.start_time
-                yield elapsed_time, line
-                line_count += 1
+            chunk_count = 0
+            while chunk := input_stream.read1(CHUNK_BYTES):
+                text = decoder.decode(chunk)
+                if text:
+                    # Use elapsed time since setup
+                    elapsed_time = time.monotonic() - self.start_time
+                    yield elapsed_time, text
+                    chunk_count += 1
+            text = decoder.decode(b"", final=True)
+            if text:
+                yield time.monotonic() - self.start_time, text
+                chunk_count += 1
         finally:
             # Close file if we opened it (but not stdin)
             if filepath != "-":
                 input_stream.close()
 
-        self.debug("lines", str(line_count))
+        self.debug("chunks", str(chunk_count))
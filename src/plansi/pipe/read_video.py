@@ -7,6 +7,17 @@ from PIL import Image
 from .base import Pipe
 
 
+def _frame_to_image(frame) -> Image.Image:
+    """Convert a decoded frame to an RGB PIL Image.
+
+    Like frame.to_image(), but builds the image straight from swscale's rgb24
+    plane (stride and all) instead of copying it row by row into a bytearray,
+    then to bytes, then into the image.
+    """
+    plane = frame.reformat(format="rgb24").planes[0]
+    return Image.frombuffer("RGB", (plane.width, plane.height), plane, "raw", "RGB", plane.line_size, 1)
+
+
 class VideoReader(Pipe):
     """Reads video files and outputs PIL Images at timestamps.
 
@@ -14,6 +25,8 @@ class VideoReader(Pipe):
     Output: (timestamp, PIL.Image) for each frame
     """
 
+    __slots__ = ("containers",)
+
     def setup(self):
         """Initialize video container cache."""
         self.containers = {}
@@ -34,6 +47,9 @@ class VideoReader(Pipe):
 
         container = self.containers[filepath]
         stream = container.streams.video[0]
+        # Let FFmpeg decode on all cores (frame + slice threading); the
+        # reader ends up waiting on it less while chafa renders
+        stream.thread_type = "AUTO"
 
         # Get target FPS if specified
 
@@ -45,6 +61,7 @@ class VideoReader(Pipe):
         skipped_count = 0
 
         self.debug("fps", self.args.fps or "original")
+        debug = getattr(self.args, "debug", False)
 
         # Decode frames
         for frame in container.decode(stream):
@@ -56,16 +73,10 @@ class VideoReader(Pipe):
                 skipped_count += 1
                 continue
 
-            self.debug("processed", f"{frame_count}/{skipped_count}")
-
-            # Convert to PIL Image
-            img = frame.to_image()
-
-            # Ensure RGB format
-            if img.mode != "RGB":
-                img = img.convert("RGB")
+            if debug:
+                self.debug("processed", f"{frame_count}/{skipped_count}")
 
-            yield frame_time, img
+            yield frame_time, _frame_to_image(frame)
             last_time = frame_time
 
         self.debug("total", f"{frame_count}/{skipped_count}")
@@ -18,6 +18,8 @@ class ResizeWatcher(Pipe):
     Output: same stream, with Event("resize") injected after a SIGWINCH
     """
 
+    __slots__ = ("_winched", "_previous_handler")
+
     def setup(self):
         self._winched = False
         self._previous_handler = signal.signal(signal.SIGWINCH, self._on_winch)
@@ -14,6 +14,8 @@ class CastWriter(Pipe):
     Output: (timestamp, json_string) for each line of the cast file
     """
 
+    __slots__ = ("header_written",)
+
     def setup(self):
         """Track if header has been written."""
         self.header_written = False
@@ -39,8 +41,8 @@ class CastWriter(Pipe):
 
         # Convert \n to \r\n for asciinema compatibility (since it doesn't support LNM mode)
         ansi_string = ansi_string.replace("\n", "\r\n")
-        # Create cast entry: [timestamp, "o", data]
-        cast_entry = [float(f"{timestamp:.4f}"), "o", ansi_string]
+        # Create cast entry: [timestamp, "o", data], timestamp to 4 decimal places
+        cast_entry = [round(timestamp, 4), "o", ansi_string]
         yield timestamp, json.dumps(cast_entry)
 
     # The base class on_resize handles updating self.width/height
@@ -4,6 +4,8 @@ from typing import Iterator, Tuple, Any
 
 from .base import Pipe
 
+WRITE_BUFFER = 1 << 20
+
 
 class FileWriter(Pipe):
     """Writes data to a file.
@@ -12,12 +14,16 @@ class FileWriter(Pipe):
     Output: passes through input (for potential chaining)
     """
 
+    __slots__ = ("file", "line_count")
+
     def setup(self):
         """Open output file."""
         if not self.args.output:
             raise ValueError("FileWriter requires output file path in args.output")
 
-        self.file = open(self.args.output, "w")
+        # Nothing reads the file until we're done, so let writes pile up in a
+        # large buffer; teardown's close() flushes the rest
+        self.file = open(self.args.output, "w", buffering=WRITE_BUFFER)
         self.line_count = 0
 
     def teardown(self):
@@ -28,9 +34,10 @@ class FileWriter(Pipe):
 
     def process(self, timestamp: float, data: Any) -> Iterator[Tuple[float, Any]]:
         """Write data to file and pass through."""
-        # Write data with newline
-        self.file.write(data + "\n")
-        self.file.flush()
+        # Write data then newline - two appends to the buffer rather than
+        # copying a whole frame just to add one character
+        self.file.write(data)
+        self.file.write("\n")
         self.line_count += 1
 
         # Pass through for potential chaining
@@ -13,6 +13,7 @@ from .pipe import (
     FileWriter,
     TerminalPlayer,
     ResizeWatcher,
+    Prefetch,
 )
 
 
@@ -37,11 +38,14 @@ def get_input(args):
         return AnsiReader(input_list, args)
     else:
         # Video file input - convert to ANSI, following the terminal's size
-        # when we're playing live (SIGWINCH doesn't exist on Windows)
-        video = VideoReader(input_list, args)
+        # when we're playing live (SIGWINCH doesn't exist on Windows).
+        # Decoding runs a couple of frames ahead on a worker thread; the
+        # resize watcher installs a signal handler so stays on this one.
+        video = Prefetch(VideoReader(input_list, args), args)
         if args.stdout and hasattr(signal, "SIGWINCH"):
-            video = ResizeWatcher(video, args)
-        return ImageToAnsi(video, args)
+            return ImageToAnsi(ResizeWatcher(video, args), args)
+        # Nothing to watch, so chafa renders ahead on a worker of its own
+        return Prefetch(ImageToAnsi(video, args), args)
 
 
 def get_processor(input_pipe, args):
@@ -4,22 +4,19 @@ import re
 from plansi import perceptual
 
 
+# Matches 38;2;r;g;b (foreground) and 48;2;r;g;b (background) in one pass
+_RGB_PATTERN = re.compile(r"\x1b\[([34])8;2;(\d+);(\d+);(\d+)m")
+
+
 def extract_rgb_from_ansi(ansi_text):
     """Extract RGB values from ANSI escape sequences."""
-    # Pattern to match 38;2;r;g;b (foreground) and 48;2;r;g;b (background)
-    fg_pattern = r"\x1b\[38;2;(\d+);(\d+);(\d+)m"
-    bg_pattern = r"\x1b\[48;2;(\d+);(\d+);(\d+)m"
-
     fg_colors = []
     bg_colors = []
 
-    for match in re.finditer(fg_pattern, ansi_text):
-        r, g, b = int(match.group(1)), int(match.group(2)), int(match.group(3))
-        fg_colors.append((r, g, b))
-
-    for match in re.finditer(bg_pattern, ansi_text):
-        r, g, b = int(match.group(1)), int(match.group(2)), int(match.group(3))
-        bg_colors.append((r, g, b))
+    for match in _RGB_PATTERN.finditer(ansi_text):
+        kind, r, g, b = match.groups()
+        colors = fg_colors if kind == "3" else bg_colors
+        colors.append((int(r), int(g), int(b)))
 
     return fg_colors, bg_colors
 
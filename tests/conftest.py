@@ -0,0 +1,6 @@
+"""Shared test setup: make the in-tree package importable."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -1,10 +1,5 @@
 """Tests for the Implied class."""
 
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 from plansi.implied import Implied, implied
 
 
@@ -95,6 +90,12 @@ def test_implied_int_conversion():
     assert result == [0, 1, 2]
 
 
+def test_implied_float_conversion():
+    """Test float() conversion for passing values on to C APIs."""
+    assert float(Implied(0.3)) == 0.3
+    assert float(Implied(2)) == 2.0
+
+
 def test_implied_container_operations():
     """Test container-like operations."""
     val = Implied([1, 2, 3])
@@ -170,3 +171,9 @@ def test_implied_iteration():
     val = Implied("abc")
     result = list(val)
     assert result == ["a", "b", "c"]
+
+
+def test_implied_format_spec():
+    """Test format specs apply to the wrapped value."""
+    assert f"{Implied(5.0):.1f}" == "5.0"
+    assert f"{Implied(42):>4}" == "  42"
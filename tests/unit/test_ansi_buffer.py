@@ -111,3 +111,111 @@ def test_boards_track_resize_events():
     assert events
     assert (pipe.truth_board.width, pipe.truth_board.height) == (20, 5)
     assert (pipe.viewer_board.width, pipe.viewer_board.height) == (20, 5)
+
+
+def test_input_resizing_only_the_truth_board_is_clamped_to_the_viewer():
+    """CSI 8;rows;cols t grows the truth board alone; rows past the viewer are dropped."""
+    frames = [
+        (0.0, "\x1b[1;1Hhello"),
+        (1.0, "\x1b[8;40;100t\x1b[1;1Hjelly\x1b[30;1Hworld"),
+    ]
+    output, pipe = run_pipe(frames)
+    assert pipe.truth_board.height > pipe.viewer_board.height
+    assert replay(output)[0] == "jelly"
+    assert "world" not in output[-1][1]
+
+
+def test_runs_of_changed_cells_share_one_cursor_move():
+    frames = [
+        (0.0, "\x1b[1;1HHello     "),
+        (1.0, "\x1b[1;1HHeyyy     "),
+    ]
+    output, _ = run_pipe(frames)
+    _, diff = output[1]
+    assert diff.count("\x1b[") - diff.count("m") == 1  # one CUP, however many SGRs
+    assert diff.startswith("\x1b[1;3H")
+    assert replay(output) == ["Heyyy", "", ""]
+
+
+def test_viewer_board_tracks_wide_and_narrow_overwrites():
+    frames = [
+        (0.0, "\x1b[1;1Hab中cd     "),
+        (1.0, "\x1b[1;1Ha中xcd     "),  # wide over narrow, narrow over wide
+        (2.0, "\x1b[1;1Ha中xcD     "),
+    ]
+    output, pipe = run_pipe(frames)
+    truth = pipe.truth_board.blitter.primary_buffer.grid
+    viewer = pipe.viewer_board.blitter.primary_buffer.grid
+    assert viewer == truth
+    assert viewer[0][5] is truth[0][5]  # plain cells are shared, not rebuilt
+    assert replay(output)[0] == "a中xcD"
+
+
+def test_cached_positions_replay_exactly():
+    frames = [
+        (0.0, "\x1b[1;1Hab        \x1b[2;1Hcd        \x1b[3;1Hef        "),
+        (1.0, "\x1b[1;1HaZ        \x1b[2;1HXd        \x1b[3;1HeY        "),
+    ]
+    output, pipe = run_pipe(frames, make_args(cache_position=True))
+    assert "Z\r\nX" in output[1][1]  # next row's first column is just a CR LF away
+    truth = pipe.truth_board.blitter.current_buffer
+    assert replay(output) == [truth.get_line_text(y).rstrip() for y in range(3)]
+
+
+def test_cached_positions_use_the_shortest_relative_move():
+    frames = [
+        (0.0, "\x1b[1;1Habcdefghij\x1b[2;1Habcdefghij\x1b[3;1Habcdefghij"),
+        (1.0, "\x1b[1;1HaBcdeFghij\x1b[2;1HabcdefGhij\x1b[3;1HAbcdefghij"),
+    ]
+    output, pipe = run_pipe(frames, make_args(cache_position=True))
+    # Forward along the row, straight down a row, then back to a row start
+    assert output[1][1].endswith("B\x1b[3CF\x1b[BG\r\nA")
+    truth = pipe.truth_board.blitter.current_buffer
+    assert replay(output) == [truth.get_line_text(y).rstrip() for y in range(3)]
+
+
+def test_frames_that_draw_nothing_skip_the_cell_walk(monkeypatch):
+    """A row held back by the threshold isn't re-examined until something draws."""
+
+    def frames():
+        yield 0.0, "\x1b[1;1H\x1b[38;2;136;147;158mx"
+        yield 1.0, "\x1b[1;1H\x1b[38;2;130;141;151mx"  # suppressed: row 1 still differs
+        monkeypatch.setattr(AnsiBuffer, "_cells_different", None)  # would blow up if any cell were compared
+        yield 2.0, "\x1b[3;1H\x1b[1m"  # cursor move and SGR only
+
+    pipe = AnsiBuffer(frames(), make_args())
+    pipe.height = 3
+    assert len(list(pipe)) == 1
+    assert pipe.frame_count == 3
+
+
+def test_only_rows_drawn_on_are_compared(monkeypatch):
+    compared = []
+
+    def frames():
+        yield 0.0, "\x1b[1;1H\x1b[38;2;136;147;158mx"
+        yield 1.0, "\x1b[1;1H\x1b[38;2;130;141;151mx"  # suppressed: row 1 still differs
+        compared.clear()
+        yield 2.0, "\x1b[3;1Hz"
+
+    pipe = AnsiBuffer(frames(), make_args())
+    pipe.height = 3
+    cells_different = AnsiBuffer._cells_different
+
+    def recording(self, viewer_cell, truth_cell):
+        compared.append(truth_cell[1])
+        return cells_different(self, viewer_cell, truth_cell)
+
+    monkeypatch.setattr(AnsiBuffer, "_cells_different", recording)
+    output = list(pipe)
+    assert output[-1][1].endswith("z")
+    assert compared == ["z"]
+
+
+def test_zero_threshold_emits_any_style_change():
+    frames = [
+        (0.0, "\x1b[1;1H\x1b[38;2;136;147;158mx"),
+        (1.0, "\x1b[1;1H\x1b[38;2;136;147;159mx"),  # one step of blue
+    ]
+    output, _ = run_pipe(frames, make_args(threshold=0))
+    assert "\x1b[38;2;136;147;159m" in output[1][1]
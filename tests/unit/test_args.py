@@ -1,27 +1,29 @@
 """Tests for argument parsing and implied defaults."""
 
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
-
 from plansi.args import parse_args, _detect_input_format
 from plansi.implied import implied
 from unittest.mock import patch
 
+import pytest
+
 
 def test_detect_input_format():
     """Test input format detection from various paths."""
     # Local files
     assert _detect_input_format("video.mp4") == "video"
     assert _detect_input_format("recording.cast") == "cast"
+    assert _detect_input_format("RECORDING.CAST") == "cast"
     assert _detect_input_format("movie.avi") == "video"
     assert _detect_input_format("data.txt") == "video"  # Default to video
+    assert _detect_input_format("takes.v2/video") == "video"  # Dots in directories don't count
 
     # URLs
     assert _detect_input_format("http://example.com/video.mp4") == "video"
     assert _detect_input_format("https://example.com/recording.cast") == "cast"
     assert _detect_input_format("http://stream.example.com/live") == "video"
+    assert _detect_input_format("https://example.com/recording.cast?token=abc") == "cast"
+    assert _detect_input_format("https://example.com/recording.cast#t=10") == "cast"
+    assert _detect_input_format("https://example.com/play?file=x.cast") == "video"
 
     # stdin
     assert _detect_input_format("-") == "ansi"
@@ -46,6 +48,26 @@ def test_default_args():
     assert args.perceptual and implied(args.perceptual)  # Perceptual enabled for video input
 
 
+def test_repeated_parses_return_independent_namespaces():
+    """Test that cached parses hand out copies callers can change freely."""
+    first = parse_args(["input.mp4", "out.cast"])
+    first.title = "changed"
+    first.threshold = 1.0
+
+    second = parse_args(["input.mp4", "out.cast"])
+    assert second is not first
+    assert not hasattr(second, "title")
+    assert second.threshold == 5.0 and implied(second.threshold)
+
+
+def test_width_follows_the_terminal_between_parses(monkeypatch):
+    """Test that a changed terminal width isn't hidden by the parse cache."""
+    monkeypatch.setenv("COLUMNS", "100")
+    assert parse_args(["input.mp4"]).width == 100
+    monkeypatch.setenv("COLUMNS", "120")
+    assert parse_args(["input.mp4"]).width == 120
+
+
 def test_cast_input_implies():
     """Test that cast input implies different defaults."""
     args = parse_args(["recording.cast"])
@@ -131,6 +153,29 @@ def test_explicit_realtime_overrides_tty_detection():
         assert not args.realtime and not implied(args.realtime)  # User explicitly disabled it
 
 
+@patch("sys.stdout.isatty", return_value=True)
+def test_realtime_playback_lowers_work_factor(mock_isatty):
+    """Test that realtime playback trades chafa quality for speed."""
+    args = parse_args(["input.mp4"])
+    assert args.work_factor == 0.3 and implied(args.work_factor)
+
+    args = parse_args(["input.mp4", "output.cast"])
+    assert args.work_factor == 1.0 and implied(args.work_factor)  # Recordings keep full quality
+
+
+def test_explicit_work_factor():
+    """Test explicit work factor is used as given."""
+    args = parse_args(["input.mp4", "--work-factor", "0.5"])
+    assert args.work_factor == 0.5 and not implied(args.work_factor)
+
+
+@pytest.mark.parametrize("value", ["2", "-0.1", "nan", "fast"])
+def test_work_factor_outside_unit_interval_is_rejected(value):
+    """Test bad work factors fail at parse time rather than on the first frame."""
+    with pytest.raises(SystemExit):
+        parse_args(["input.mp4", "--work-factor", value])
+
+
 def test_explicit_stdout_output():
     """Test explicit stdout output (plansi input -)."""
     args = parse_args(["input.mp4", "-"])
@@ -156,3 +201,21 @@ def test_complex_argument_interaction():
     # Processing
     assert args.threshold == 2.0 and not implied(args.threshold)  # Explicitly set
     assert not args.perceptual and implied(args.perceptual)  # Cast format implies no perceptual
+
+
+def test_repeated_parses_do_not_share_state():
+    """The parser is built once; one parse's implied values must not leak into the next."""
+    assert parse_args(["video.mp4", "--no-perceptual"]).threshold == 0.0
+    args = parse_args(["video.mp4"])
+    assert args.threshold == 5.0 and implied(args.threshold)
+    assert args.output == "-" and implied(args.output)
+
+
+def test_width_follows_columns_env(monkeypatch):
+    """$COLUMNS wins over probing the terminal, but never over an explicit --width."""
+    monkeypatch.setenv("COLUMNS", "123")
+    args = parse_args(["input.mp4"])
+    assert args.width == 123 and implied(args.width)
+
+    args = parse_args(["input.mp4", "--width", "40"])
+    assert args.width == 40 and not implied(args.width)
@@ -3,11 +3,6 @@
 from typing import Iterator, Tuple, Any
 from argparse import Namespace
 
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 from plansi.pipe.base import Pipe, Event
 
 
@@ -51,9 +46,12 @@ class TransformPipe(Pipe):
 class EventGeneratorPipe(Pipe):
     """Test pipe that generates events."""
 
+    def setup(self):
+        self.first_seen = False
+
     def process(self, timestamp: float, data: Any) -> Iterator[Tuple[float, Any]]:
         """Generate a resize event before first data."""
-        if not hasattr(self, "first_seen"):
+        if not self.first_seen:
             self.first_seen = True
             # Emit resize event
             yield 0.0, Event("resize", width=120, height=40)
@@ -70,12 +68,10 @@ class EventConsumerPipe(Pipe):
         """Pass through non-event data."""
         yield timestamp, data
 
-    def on_test(self, timestamp: float, msg: str) -> Iterator[Tuple[float, Any]]:
+    def on_test(self, timestamp: float, msg: str) -> None:
         """Handle test events and consume them."""
+        # Returning None instead of a generator consumes the event
         self.test_events.append(msg)
-        # Don't yield anything - consume the event
-        return
-        yield  # Make it a generator
 
 
 class EventModifierPipe(Pipe):
@@ -143,6 +139,21 @@ def test_event_consumption():
     assert consumer.test_events == ["hello", "world"]
 
 
+def test_generator_handlers_can_still_consume_events():
+    """Test that a handler generator yielding nothing also consumes its event."""
+
+    class GeneratorConsumerPipe(EventConsumerPipe):
+        def on_test(self, timestamp: float, msg: str) -> Iterator[Tuple[float, Any]]:
+            self.test_events.append(msg)
+            return
+            yield
+
+    consumer = GeneratorConsumerPipe(SourcePipe([(0.0, Event("test", msg="hello")), (1.0, "data")]))
+
+    assert list(consumer) == [(1.0, "data")]
+    assert consumer.test_events == ["hello"]
+
+
 def test_event_modification():
     """Test that events can be modified by handlers."""
     source_data = [(0.0, Event("resize", width=80, height=24)), (1.0, "data")]
@@ -300,3 +311,47 @@ def test_event_handler_can_yield_multiple():
     assert result[1] == (1.0, "burst_1")
     assert result[2] == (2.0, "burst_2")
     assert result[3] == (10.0, "normal")
+
+
+def test_debug_log_file_is_kept_open_until_teardown(tmp_path, monkeypatch):
+    """Test debug messages go to one log handle, closed when the pipe finishes."""
+    monkeypatch.chdir(tmp_path)
+    args = Namespace(log_file="debug.log")  # no directory part
+    echo = EchoPipe(SourcePipe([(0.0, "a"), (1.0, "b")]), args)
+
+    for timestamp, _ in echo:
+        echo.debug("at", timestamp)
+        log = echo.log
+        assert not log.closed
+
+    assert log.closed and echo.log is None
+    assert (tmp_path / "debug.log").read_text() == "EchoPipe.at: 0.0\nEchoPipe.at: 1.0\n"
+
+
+def test_a_handlers_attribute_does_not_break_dispatch():
+    """Test that a subclass's own state can't shadow the dispatch table."""
+
+    class HandlersPipe(Pipe):
+        def setup(self):
+            self.handlers = []
+
+        def process(self, timestamp: float, data: Any) -> Iterator[Tuple[float, Any]]:
+            yield timestamp, data
+
+        def on_custom(self, timestamp: float, value: str) -> Iterator[Tuple[float, Any]]:
+            self.handlers.append(value)
+            yield timestamp, value
+
+    pipe = HandlersPipe(SourcePipe([(0.0, Event("custom", value="hello"))]))
+    assert list(pipe) == [(0.0, "hello")]
+    assert pipe.handlers == ["hello"]
+
+
+def test_package_stages_carry_no_instance_dict():
+    """Test that every shipped stage keeps its state in slots."""
+    import plansi.pipe
+
+    for name in plansi.pipe.__all__:
+        stage = getattr(plansi.pipe, name)
+        assert not hasattr(stage(None, Namespace(width=10)), "__dict__"), name
+    assert hasattr(EchoPipe(None), "__dict__")  # Undeclared subclasses keep theirs
@@ -1,5 +1,7 @@
 """TerminalPlayer: late frames slow down, they never vanish."""
 
+import io
+import os
 from argparse import Namespace
 
 from plansi.pipe.player import TerminalPlayer
@@ -27,3 +29,60 @@ def test_paced_frames_sleep_to_their_timestamp(capsys):
     list(player)
     assert player.late_frames == 0
     assert "b" in capsys.readouterr().out
+
+
+class CountingBuffer(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+def test_offline_frames_are_batched_into_one_write(monkeypatch):
+    """Without realtime pacing, frames pile up and land in a single write."""
+    buffer = CountingBuffer()
+    monkeypatch.setattr("sys.stdout", io.TextIOWrapper(buffer))
+    frames = [(0.0, "one"), (1.0, "two"), (2.0, "three")]
+    player = TerminalPlayer(iter(frames), Namespace(realtime=False, debug=False))
+    list(player)
+
+    written = buffer.getvalue().decode()
+    assert written.index("one") < written.index("two") < written.index("three")
+    assert buffer.writes == 2  # terminal setup, then everything else at teardown
+
+
+def test_offline_output_follows_text_already_printed(monkeypatch):
+    buffer = io.BytesIO()
+    monkeypatch.setattr("sys.stdout", io.TextIOWrapper(buffer))
+    print("before", end="")
+    list(TerminalPlayer(iter([(0.0, "frame")]), Namespace(realtime=False, debug=False)))
+    written = buffer.getvalue().decode()
+    assert written.index("before") < written.index("frame")
+
+
+def test_realtime_frames_go_straight_to_the_fd(monkeypatch):
+    read_fd, write_fd = os.pipe()
+    try:
+        with open(write_fd, "w") as stdout:
+            monkeypatch.setattr("sys.stdout", stdout)
+            player = TerminalPlayer(iter([(0.0, "one"), (0.0, "two")]), Namespace(realtime=True, debug=False))
+            list(player)
+            assert player.stdout_fd == write_fd
+        written = os.read(read_fd, 65536).decode()
+    finally:
+        os.close(read_fd)
+    assert written.index("one") < written.index("two")
+
+
+def test_debug_overlay_leaves_the_cursor_where_the_frame_did(capsys):
+    """Diffs continue from the cursor and style the last frame left, so the
+    overlay below the video must save and restore them."""
+    player = TerminalPlayer(iter([(0.0, "\x1b[31mone")]), Namespace(realtime=True, debug=True))
+    list(player)
+    written = capsys.readouterr().out
+    overlay = written[written.index("one") + len("one") :]
+    assert overlay.startswith("\x1b7") and "frame" in overlay
+    assert overlay.index("\x1b8") > overlay.index("frame")
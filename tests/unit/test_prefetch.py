@@ -0,0 +1,57 @@
+"""Prefetch: upstream stages on a worker thread, stream unchanged."""
+
+import threading
+
+import pytest
+
+from plansi.pipe.base import Pipe, Event
+from plansi.pipe.prefetch import Prefetch
+
+
+class Source(Pipe):
+    """Yields a fixed list of items, recording whether it was torn down."""
+
+    def __init__(self, items):
+        super().__init__(None)
+        self.items = items
+        self.torn_down = False
+        self.threads = set()
+
+    def __iter__(self):
+        with self:
+            for item in self.items:
+                self.threads.add(threading.current_thread())
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+
+    def teardown(self):
+        self.torn_down = True
+
+
+def test_stream_comes_through_in_order_with_events():
+    resize = Event("resize", width=10, height=5)
+    items = [(0.0, "a"), (0.0, resize), (1.0, "b"), (2.0, "c")]
+    source = Source(items)
+    assert list(Prefetch(source)) == items
+    assert threading.current_thread() not in source.threads
+    assert source.torn_down
+
+
+def test_upstream_errors_are_reraised_downstream():
+    source = Source([(0.0, "a"), ValueError("bad frame")])
+    output = []
+    with pytest.raises(ValueError, match="bad frame"):
+        for item in Prefetch(source):
+            output.append(item)
+    assert output == [(0.0, "a")]
+
+
+def test_closing_early_stops_the_worker():
+    source = Source([(float(i), i) for i in range(1000)])
+    prefetch = Prefetch(source, depth=1)
+    stream = iter(prefetch)
+    assert next(stream) == (0.0, 0)
+    stream.close()
+    assert not prefetch.worker.is_alive()
+    assert source.torn_down
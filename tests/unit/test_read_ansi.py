@@ -0,0 +1,20 @@
+"""AnsiReader: chunked reads that never split a character."""
+
+from argparse import Namespace
+
+from plansi.pipe import read_ansi
+from plansi.pipe.read_ansi import AnsiReader
+
+
+def test_chunks_reassemble_the_input(tmp_path, monkeypatch):
+    text = "héllo\n\x1b[31mwörld ✓\n" * 3
+    path = tmp_path / "in.ans"
+    path.write_text(text, encoding="utf-8")
+    monkeypatch.setattr(read_ansi, "CHUNK_BYTES", 3)  # forces splits inside characters
+
+    output = list(AnsiReader([(0.0, str(path))], Namespace(width=80)))
+
+    assert len(output) > 1
+    assert "".join(chunk for _, chunk in output) == text
+    timestamps = [timestamp for timestamp, _ in output]
+    assert timestamps == sorted(timestamps)
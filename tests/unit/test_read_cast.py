@@ -0,0 +1,66 @@
+"""CastReader: header handling and event filtering."""
+
+from argparse import Namespace
+
+import pytest
+
+from plansi.implied import Implied
+from plansi.pipe import read_cast
+from plansi.pipe.read_cast import CastReader
+
+
+HEADER = '{"version": 2, "width": 20, "height": 5}'
+
+
+def read(tmp_path, *lines, header=HEADER, width=20):
+    path = tmp_path / "in.cast"
+    path.write_text(header + "\n" + "\n".join(lines) + "\n", encoding="utf-8")
+    return list(CastReader([(0.0, str(path))], Namespace(width=width)))
+
+
+def test_header_resizes_an_implied_width(tmp_path):
+    (_, event), output = read(tmp_path, '[0.5, "o", "hi"]', width=Implied(80))
+    assert event.name == "resize" and (event.kwargs["width"], event.kwargs["height"]) == (20, 5)
+    assert output == (0.5, "hi")
+
+
+def test_explicit_width_ignores_the_header_size(tmp_path):
+    assert read(tmp_path, '[0.5, "o", "hi"]') == [(0.5, "hi")]
+
+
+def test_unsupported_version_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported cast version"):
+        read(tmp_path, header='{"version": 1}')
+
+
+def test_only_output_events_come_through(tmp_path):
+    output = read(
+        tmp_path,
+        '[0.5, "o", "hello"]',
+        '[0.6, "i", "typed"]',
+        '[0.7, "r", "30x10"]',
+        '[0.8,"m",""]',
+        '[0.9, "i", "\\"quoted\\" \\u00e9"]',
+        '[1.0, "o", "\\u001b[1mworld"]',
+    )
+    assert output == [(0.5, "hello"), (1.0, "\x1b[1mworld")]
+
+
+def test_skipped_event_types_are_never_decoded(tmp_path, monkeypatch):
+    decoded = []
+    loads = read_cast.json.loads
+    monkeypatch.setattr(read_cast.json, "loads", lambda text: decoded.append(text) or loads(text))
+    output = read(tmp_path, '[0.5, "o", "hello"]', '[0.6, "i", "typed"]', '[0.7, "r", "30x10"]')
+    assert output == [(0.5, "hello")]
+    assert decoded == [HEADER, '[0.5, "o", "hello"]']
+
+
+def test_malformed_entries_still_raise(tmp_path):
+    with pytest.raises(ValueError, match="line 3"):
+        read(tmp_path, '[0.5, "o", "hello"]', "[0.6, 1]")
+
+
+@pytest.mark.parametrize("entry", ['[0.6, "i"]', '[0.6, "i", "a", "extra"]', '[0.6, "i", "unterminated'])
+def test_malformed_skipped_event_types_still_raise(tmp_path, entry):
+    with pytest.raises(ValueError, match="line 3"):
+        read(tmp_path, '[0.5, "o", "hello"]', entry)
@@ -0,0 +1,28 @@
+"""VideoReader: decoding frames from a real (tiny) video file."""
+
+from argparse import Namespace
+
+import av
+from PIL import Image
+
+from plansi.pipe.read_video import VideoReader
+
+
+def write_video(path, frames=3):
+    with av.open(str(path), "w") as container:
+        stream = container.add_stream("mpeg4", rate=10)
+        stream.width = stream.height = 16
+        stream.pix_fmt = "yuv420p"
+        for i in range(frames):
+            frame = av.VideoFrame.from_image(Image.new("RGB", (16, 16), (i * 40, 0, 0)))
+            container.mux(stream.encode(frame))
+        container.mux(stream.encode())
+
+
+def test_frames_decode_without_a_debug_flag(tmp_path):
+    """Pipes built from a partial namespace must not trip over optional flags."""
+    path = tmp_path / "in.mp4"
+    write_video(path)
+    output = list(VideoReader([(0.0, str(path))], Namespace(width=10, fps=None)))
+    assert len(output) == 3
+    assert all(isinstance(image, Image.Image) and image.size == (16, 16) for _, image in output)
@@ -67,3 +67,32 @@ def test_image_to_ansi_rebuilds_canvas_on_resize():
     assert [event.kwargs["width"] for event in resizes] == [80, 40]
     assert resizes[1].kwargs["height"] == 10  # 40 * (32/64) * 0.5, aspect re-derived
     assert pipe.width == 40
+
+
+def test_image_to_ansi_renders_repeated_frames_once(monkeypatch):
+    from chafa import Canvas
+
+    draws = []
+    draw_all_pixels = Canvas.draw_all_pixels
+
+    def counting_draw(self, *args):
+        draws.append(args)
+        return draw_all_pixels(self, *args)
+
+    monkeypatch.setattr(Canvas, "draw_all_pixels", counting_draw)
+
+    img = Image.new("RGB", (64, 32), (200, 40, 40))
+    source = iter(
+        [
+            (0.0, img),
+            (1.0, img.copy()),
+            (2.0, Event("resize", width=40, height=0)),
+            (3.0, img),
+        ]
+    )
+    pipe = ImageToAnsi(source, Namespace(width=80, debug=False))
+    frames = [data for _, data in pipe if isinstance(data, str)]
+
+    assert len(frames) == 3
+    assert frames[0] == frames[1]
+    assert len(draws) == 2  # once per canvas